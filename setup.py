@@ -24,7 +24,8 @@ setup(
     extras_require={
         "excel-legacy": ["xlrd"],
         "ods": ["odfpy"],
-        "all": ["xlrd", "odfpy"],
+        "fast": ["lxml", "orjson"],
+        "all": ["xlrd", "odfpy", "lxml", "orjson"],
     },
     entry_points={
         "console_scripts": [
@@ -494,7 +494,7 @@ def build_parser() -> argparse.ArgumentParser:
     heal.add_argument("output_positional", nargs="?", default=None, help="Optional output path")
     heal.add_argument("-o", "--out", dest="out_dir", help="Output directory")
     heal.add_argument("--output", dest="output_flag", help="Explicit output path")
-    heal.add_argument("--format", choices=["xlsx", "csv"], default="xlsx", help="Output format for tabular healing")
+    heal.add_argument("--format", choices=["xlsx", "csv", "jsonl"], default="xlsx", help="Output format for tabular healing")
     heal.add_argument("--in-place", action="store_true", help="Overwrite the input (CSV/tabular only)")
     heal.add_argument("--sheet", dest="sheet_name", help="Workbook sheet name for tabular rescue mode")
     heal.add_argument("--all-sheets", dest="all_sheets", action="store_true", help="Consolidate compatible workbook sheets in tabular rescue mode")
@@ -586,8 +586,8 @@ def heal_default_paths(args: argparse.Namespace, input_path: Path, backend: str)
     else:
         if backend == "excel":
             output_name = f"{input_path.stem}-cleaned{input_path.suffix}"
-        elif args.format == "csv":
-            output_name = f"{input_path.stem}-clean.csv"
+        elif args.format in {"csv", "jsonl"}:
+            output_name = f"{input_path.stem}-clean.{args.format}"
         else:
             output_name = f"{input_path.stem}-cleaned.xlsx"
         output_path = out_dir / output_name
@@ -737,10 +737,20 @@ def run_report(args: argparse.Namespace) -> int:
         return classify_backend_exception(exc)
 
 
+def tabular_sidecar_paths(output_path: Path) -> tuple[Path, Path]:
+    """Quarantine and changelog paths next to *output_path*, always distinct from it."""
+    stem = output_path.stem
+    if stem.endswith("-clean"):
+        stem = stem[: -len("-clean")]
+    return (
+        output_path.with_name(f"{stem}-quarantine{output_path.suffix}"),
+        output_path.with_name(f"{stem}-changelog{output_path.suffix}"),
+    )
+
+
 def write_tabular_csv_outputs(result: dict[str, Any], output_path: Path) -> dict[str, str]:
     clean_path = output_path
-    quarantine_path = output_path.with_name(output_path.stem.replace("-clean", "-quarantine") + output_path.suffix)
-    changelog_path = output_path.with_name(output_path.stem.replace("-clean", "-changelog") + output_path.suffix)
+    quarantine_path, changelog_path = tabular_sidecar_paths(output_path)
     ensure_parent(clean_path)
     headers = result["headers"]
 
@@ -757,7 +767,14 @@ def write_tabular_csv_outputs(result: dict[str, Any], output_path: Path) -> dict
     ]
     quarantine_rows = [entry.row + [entry.reason] for entry in result["quarantine"]]
     changelog_rows = [
-        [change.action, change.row_number, change.column_name, change.old_value, change.new_value, change.reason]
+        [
+            change.action_taken,
+            change.original_row_number,
+            change.column_affected,
+            change.original_value,
+            change.new_value,
+            change.reason,
+        ]
         for change in result["changelog"]
     ]
 
@@ -783,6 +800,71 @@ def write_tabular_csv_outputs(result: dict[str, Any], output_path: Path) -> dict
     }
 
 
+def jsonl_encoder():
+    """Return a record -> bytes line encoder, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return lambda record: (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+    return lambda record: orjson.dumps(record, default=str) + b"\n"
+
+
+def write_tabular_jsonl_outputs(result: dict[str, Any], output_path: Path) -> dict[str, str]:
+    clean_path = output_path
+    quarantine_path, changelog_path = tabular_sidecar_paths(output_path)
+    ensure_parent(clean_path)
+    headers = result["headers"]
+    encode = jsonl_encoder()
+
+    def write_records(path: Path, records) -> None:
+        with path.open("wb") as handle:
+            for record in records:
+                handle.write(encode(record))
+
+    write_records(
+        clean_path,
+        (
+            {
+                "row_number": entry.row_num,
+                "values": dict(zip(headers, entry.row)),
+                "was_modified": bool(entry.was_modified),
+                "needs_review": bool(entry.needs_review),
+            }
+            for entry in result["clean_data"]
+        ),
+    )
+    write_records(
+        quarantine_path,
+        (
+            {
+                "row_number": entry.row_num,
+                "values": dict(zip(headers, entry.row)),
+                "quarantine_reason": entry.reason,
+            }
+            for entry in result["quarantine"]
+        ),
+    )
+    write_records(
+        changelog_path,
+        (
+            {
+                "action": change.action_taken,
+                "row_number": change.original_row_number,
+                "column_name": change.column_affected,
+                "old_value": change.original_value,
+                "new_value": change.new_value,
+                "reason": change.reason,
+            }
+            for change in result["changelog"]
+        ),
+    )
+    return {
+        "clean": str(clean_path),
+        "quarantine": str(quarantine_path),
+        "changelog": str(changelog_path),
+    }
+
+
 def run_heal(args: argparse.Namespace) -> int:
     input_path = Path(args.input)
     if not input_path.exists():
@@ -796,8 +878,8 @@ def run_heal(args: argparse.Namespace) -> int:
             sheet_name=args.sheet_name,
             all_sheets=args.all_sheets,
         )
-        if backend == "excel" and args.format == "csv":
-            raise CliError("Workbook-native healing does not support --format csv.", EXIT_COMMAND_ERROR)
+        if backend == "excel" and args.format != "xlsx":
+            raise CliError(f"Workbook-native healing does not support --format {args.format}.", EXIT_COMMAND_ERROR)
 
         out_dir, output_path, summary_path = heal_default_paths(args, input_path, backend)
         if not args.in_place and not args.dry_run:
@@ -861,6 +943,8 @@ def run_heal(args: argparse.Namespace) -> int:
                     headers=result["headers"],
                 )
                 output_manifest = {"workbook": str(output_path)}
+            elif args.format == "jsonl":
+                output_manifest = write_tabular_jsonl_outputs(result, output_path)
             else:
                 output_manifest = write_tabular_csv_outputs(result, output_path)
             write_json(summary_path, summary)
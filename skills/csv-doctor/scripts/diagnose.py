@@ -47,6 +47,8 @@ def row_cells_from_values(values) -> list[str]:
 
 
 def rebuild_raw_rows(loaded: dict) -> list[list[str]]:
+    if loaded.get("raw_rows") is not None:
+        return loaded["raw_rows"]
     raw_text = loaded.get("raw_text")
     delimiter = loaded.get("delimiter")
     if raw_text is not None and delimiter is not None:
@@ -195,34 +195,47 @@ def main() -> None:
             encoding="utf-8",
         )
 
+    modified_rows = review_rows = 0
+    for entry in result["clean_data"]:
+        if entry.was_modified:
+            modified_rows += 1
+        if entry.needs_review:
+            review_rows += 1
+
     width = 60
-    print()
-    print("═" * width)
-    print("  CSV Doctor  ·  Heal Report  (Excel output)")
-    print("═" * width)
-    print(f"  Input file   : {input_path.name}")
-    print(f"  Output file  : {output_path.name}")
-    print(f"  Mode         : {result['mode']}")
-    print(f"  Delimiter    : {result['delimiter']!r}")
-    print("─" * width)
-    print(f"  Rows in      : {result['total_in']}  (incl. column header row)")
-    print(f"  Clean Data   : {len(result['clean_data'])} rows")
-    print(f"    · was_modified = TRUE  : {sum(1 for r in result['clean_data'] if r.was_modified)}")
-    print(f"    · needs_review = TRUE  : {sum(1 for r in result['clean_data'] if r.needs_review)}")
-    print(f"  Quarantine   : {len(result['quarantine'])} rows")
+    counts = result["action_counts"]
+    lines = [
+        "",
+        "═" * width,
+        "  CSV Doctor  ·  Heal Report  (Excel output)",
+        "═" * width,
+        f"  Input file   : {input_path.name}",
+        f"  Output file  : {output_path.name}",
+        f"  Mode         : {result['mode']}",
+        f"  Delimiter    : {result['delimiter']!r}",
+        "─" * width,
+        f"  Rows in      : {result['total_in']}  (incl. column header row)",
+        f"  Clean Data   : {len(result['clean_data'])} rows",
+        f"    · was_modified = TRUE  : {modified_rows}",
+        f"    · needs_review = TRUE  : {review_rows}",
+        f"  Quarantine   : {len(result['quarantine'])} rows",
+    ]
     for reason, rows in result["quarantine_reason_counts"].items():
-        print(f"    · {reason:<40} {rows}")
-    print(f"  Changes logged: {len(result['changelog'])}")
-    print(f"    · Fixed       : {result['action_counts'].get('Fixed', 0)}")
-    print(f"    · Quarantined : {result['action_counts'].get('Quarantined', 0)}")
-    print(f"    · Removed     : {result['action_counts'].get('Removed', 0)}")
-    print(f"    · Flagged     : {result['action_counts'].get('Flagged', 0)}")
-    print("─" * width)
-    print("  ASSUMPTIONS MADE:")
+        lines.append(f"    · {reason:<40} {rows}")
+    lines += [
+        f"  Changes logged: {len(result['changelog'])}",
+        f"    · Fixed       : {counts.get('Fixed', 0)}",
+        f"    · Quarantined : {counts.get('Quarantined', 0)}",
+        f"    · Removed     : {counts.get('Removed', 0)}",
+        f"    · Flagged     : {counts.get('Flagged', 0)}",
+        "─" * width,
+        "  ASSUMPTIONS MADE:",
+    ]
     for assumption in result["assumptions"]:
-        print(f"    · {assumption}")
-    print("═" * width)
-    print()
+        lines.append(f"    · {assumption}")
+    lines += ["═" * width, ""]
+    # One write for the whole report instead of a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
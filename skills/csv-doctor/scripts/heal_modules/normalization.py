@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timedelta, timezone
+import sys
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 
 from heal_modules.shared import (
     COL,
+    CURRENCY_SYMBOL_MAP,
     HEADERS,
     N_COLS,
     SMART_QUOTES,
@@ -15,36 +18,78 @@ from heal_modules.shared import (
 )
 
 
+# The single-value normalisers are pure and see the same amounts, codes,
+# statuses and dates over and over, so their results are memoised.
+_NORMALISER_CACHE_SIZE = 16_384
+
+_DIRTY_CHARS = frozenset("\ufeff\x00\r\n" + "".join(SMART_QUOTES))
+
+
 def _clean_cell_text(value: object) -> tuple[str, list[str]]:
     """Strip BOM, null bytes, line breaks, smart quotes. Returns (cleaned_value, reasons)."""
-    new_val = _strip_nulls(value)
+    # Fast path: most cells carry none of the characters below, so skip the
+    # per-category scans and replaces entirely.
+    if type(value) is str and _DIRTY_CHARS.isdisjoint(value):
+        return value.strip(), []
+
+    new_val, reasons = _clean_dirty_cell_text(_strip_nulls(value))
+    return new_val, list(reasons)
+
+
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
+def _clean_dirty_cell_text(new_val: str) -> tuple[str, tuple[str, ...]]:
+    # Dirty values tend to repeat down a column (the same smart-quoted label,
+    # the same BOM-prefixed code), so the rewrite is memoised on the text.
+    present = _DIRTY_CHARS.intersection(new_val)
     reasons = []
 
-    if "\ufeff" in new_val:
+    # One scan finds which categories occur; only those replaces run below
+    if "\ufeff" in present:
         new_val = new_val.replace("\ufeff", "")
         reasons.append("BOM byte-order mark stripped")
-    if "\x00" in new_val:
+    if "\x00" in present:
         new_val = new_val.replace("\x00", "")
         reasons.append("Null byte removed")
-    if "\n" in new_val or "\r" in new_val:
+    if "\n" in present or "\r" in present:
         new_val = new_val.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
         reasons.append("Embedded line break replaced with space")
 
-    had_smart = any(s in new_val for s in SMART_QUOTES)
+    had_smart = False
     for smart, straight in SMART_QUOTES.items():
-        new_val = new_val.replace(smart, straight)
+        if smart in present:
+            new_val = new_val.replace(smart, straight)
+            had_smart = True
     if had_smart:
         reasons.append("Smart/curly quotes normalised to straight quotes")
 
     new_val = new_val.strip()
-    return new_val, reasons
+    return new_val, tuple(reasons)
 
 
 def _col_name(i: int) -> str:
     return HEADERS[i] if i < N_COLS else f"[col {i + 1}]"
 
 
+def _stripped_if_clean(row: list) -> list[str] | None:
+    """Stripped cells when no cell in *row* needs _clean_cell_text's rewrites, else None.
+
+    One join and one set test cover the whole row, so typical rows skip the
+    per-cell calls entirely.
+    """
+    try:
+        joined = "".join(row)
+    except TypeError:   # non-string cells take the per-cell path
+        return None
+    if _DIRTY_CHARS.isdisjoint(joined):
+        return [cell.strip() for cell in row]
+    return None
+
+
 def clean_row(row: list[str], row_num: int) -> tuple[list[str], list[Change]]:
+    stripped = _stripped_if_clean(row)
+    if stripped is not None:
+        return stripped, []
+
     cleaned, changes = [], []
     for i, cell in enumerate(row):
         new_val, reasons = _clean_cell_text(cell)
@@ -56,13 +101,16 @@ def clean_row(row: list[str], row_num: int) -> tuple[list[str], list[Change]]:
                 .strip()
             )
             changes.append(Change(
-                row_num, _col_name(i), orig_display, new_val, "Fixed", "; ".join(reasons)
+                row_num, _col_name(i), orig_display, new_val, "Fixed", sys.intern("; ".join(reasons))
             ))
         cleaned.append(new_val)
     return cleaned, changes
 
 
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
 def parse_amount_like(value: str) -> float | None:
+    if _CANONICAL_AMOUNT_RE.fullmatch(value):
+        return float(value)
     if not value.strip():
         return None
     normalised, changed, _ = normalise_amount(value)
@@ -73,22 +121,30 @@ def parse_amount_like(value: str) -> float | None:
         return None
 
 
+_CURRENCY_CODE_RE = re.compile(r"\b(USD|EUR|GBP|INR|CAD|AUD|JPY)\b", re.IGNORECASE)
+_CURRENCY_SYMBOLS = frozenset(CURRENCY_SYMBOL_MAP)
+
+
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
 def extract_currency_from_text(value: str) -> tuple[str | None, str | None]:
     raw = value.strip()
     if not raw:
         return None, None
 
-    code_match = re.search(r"\b(USD|EUR|GBP|INR|CAD|AUD|JPY)\b", raw, flags=re.IGNORECASE)
-    symbol_match = next((symbol for symbol in {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR", "¥": "JPY"} if symbol in raw), None)
+    code_match = _CURRENCY_CODE_RE.search(raw)
+    symbol_match = None
+    if not _CURRENCY_SYMBOLS.isdisjoint(raw):
+        # First symbol in map order, as before, when a cell carries several
+        symbol_match = next(symbol for symbol in CURRENCY_SYMBOL_MAP if symbol in raw)
     currency = None
     if code_match:
         currency = code_match.group(1).upper()
     elif symbol_match:
-        currency = {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR", "¥": "JPY"}[symbol_match]
+        currency = CURRENCY_SYMBOL_MAP[symbol_match]
 
     amount_candidate = raw
     if code_match:
-        amount_candidate = re.sub(r"\b(USD|EUR|GBP|INR|CAD|AUD|JPY)\b", "", amount_candidate, flags=re.IGNORECASE)
+        amount_candidate = _CURRENCY_CODE_RE.sub("", amount_candidate)
     if symbol_match:
         amount_candidate = amount_candidate.replace(symbol_match, "")
     amount_candidate = " ".join(amount_candidate.split()).strip()
@@ -105,24 +161,65 @@ MONTH_NAMES  = {
     "jan":1,"feb":2,"mar":3,"apr":4,"jun":6,"jul":7,"aug":8,
     "sep":9,"oct":10,"nov":11,"dec":12,
 }
+# Common spellings as typed ("jan", "Jan", "JAN") hit without a .lower() copy
+_MONTH_LOOKUP = {
+    variant: num
+    for name, num in MONTH_NAMES.items()
+    for variant in (name, name.title(), name.upper())
+}
+
+_ISO_DATE_RE      = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# Every non-ISO shape normalise_date understands, tried in order in one scan.
+# The outer group name (m.lastgroup) says which shape matched.
+_DATE_SHAPE_RE = re.compile(
+    r"^(?:"
+    r"(?P<iso_datetime>(?P<it_day>\d{4}-\d{2}-\d{2})T)"
+    r"|(?P<slash>(?P<sl_a>\d{1,2})/(?P<sl_b>\d{1,2})/(?P<sl_y>\d{4}))$"
+    r"|(?P<slash_iso>(?P<si_y>\d{4})/(?P<si_m>\d{1,2})/(?P<si_d>\d{1,2}))$"
+    r"|(?P<dash>(?P<da_a>\d{1,2})-(?P<da_b>\d{1,2})-(?P<da_y>\d{4}))$"
+    r"|(?P<dash_short>(?P<ds_a>\d{2})-(?P<ds_b>\d{2})-(?P<ds_y>\d{2}))$"
+    r"|(?P<month_name>(?P<mn_month>[A-Za-z]+)\s+(?P<mn_day>\d{1,2})\s+(?P<mn_y>\d{4}))$"
+    r"|(?P<unix>\d{10})$"
+    r"|(?P<serial>\d{5})$"
+    r")"
+)
 
 def _fmt(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d")
 
+def iso_day_gap(d1: str, d2: str) -> int | None:
+    """Absolute days between two YYYY-MM-DD cells, or None if either isn't a real date.
+
+    The regex already pins the layout, so the fields are sliced out directly
+    rather than going through strptime.
+    """
+    if not (d1 and d2 and _ISO_DATE_RE.match(d1) and _ISO_DATE_RE.match(d2)):
+        return None
+    try:
+        first = date(int(d1[0:4]), int(d1[5:7]), int(d1[8:10]))
+        second = date(int(d2[0:4]), int(d2[5:7]), int(d2[8:10]))
+    except ValueError:
+        return None
+    return abs((second - first).days)
+
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
 def normalise_date(value: str) -> tuple[str, bool, str]:
     v = value.strip()
-    if not v or re.match(r"^\d{4}-\d{2}-\d{2}$", v):
+    if not v or _ISO_DATE_RE.match(v):
+        return v, False, ""
+
+    m = _DATE_SHAPE_RE.match(v)
+    if not m:
         return v, False, ""
+    shape = m.lastgroup
 
     # ISO 8601 with time: 2023-01-18T00:00:00Z
-    m = re.match(r"^(\d{4}-\d{2}-\d{2})T", v)
-    if m:
-        return m.group(1), True, "ISO 8601 datetime truncated to date-only"
+    if shape == "iso_datetime":
+        return m.group("it_day"), True, "ISO 8601 datetime truncated to date-only"
 
     # DD/MM/YYYY or MM/DD/YYYY — try day-first, fall back to month-first
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", v)
-    if m:
-        a, b, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    if shape == "slash":
+        a, b, year = int(m.group("sl_a")), int(m.group("sl_b")), int(m.group("sl_y"))
         for day, month, fmt in [(a, b, "DD/MM/YYYY"), (b, a, "MM/DD/YYYY")]:
             try:
                 return _fmt(datetime(year, month, day)), True, \
@@ -132,18 +229,16 @@ def normalise_date(value: str) -> tuple[str, bool, str]:
         return v, False, ""
 
     # YYYY/MM/DD
-    m = re.match(r"^(\d{4})/(\d{1,2})/(\d{1,2})$", v)
-    if m:
-        year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    if shape == "slash_iso":
+        year, month, day = int(m.group("si_y")), int(m.group("si_m")), int(m.group("si_d"))
         try:
             return _fmt(datetime(year, month, day)), True, "Slash-separated ISO-style date normalised to YYYY-MM-DD"
         except ValueError:
             return v, False, ""
 
     # DD-MM-YYYY or MM-DD-YYYY — prefer day-first, fall back to month-first
-    m = re.match(r"^(\d{1,2})-(\d{1,2})-(\d{4})$", v)
-    if m:
-        a, b, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    if shape == "dash":
+        a, b, year = int(m.group("da_a")), int(m.group("da_b")), int(m.group("da_y"))
         for day, month, fmt in [(a, b, "DD-MM-YYYY"), (b, a, "MM-DD-YYYY")]:
             try:
                 return _fmt(datetime(year, month, day)), True, \
@@ -153,9 +248,8 @@ def normalise_date(value: str) -> tuple[str, bool, str]:
         return v, False, ""
 
     # DD-MM-YY or MM-DD-YY (two-digit year, hyphens) — prefer day-first, fall back to month-first
-    m = re.match(r"^(\d{2})-(\d{2})-(\d{2})$", v)
-    if m:
-        a, b, yr = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    if shape == "dash_short":
+        a, b, yr = int(m.group("ds_a")), int(m.group("ds_b")), int(m.group("ds_y"))
         year = 2000 + yr if yr < 50 else 1900 + yr
         for day, month, fmt in [(a, b, "DD-MM-YY"), (b, a, "MM-DD-YY")]:
             try:
@@ -166,19 +260,19 @@ def normalise_date(value: str) -> tuple[str, bool, str]:
         return v, False, ""
 
     # Month DD YYYY or Month D YYYY
-    m = re.match(r"^([A-Za-z]+)\s+(\d{1,2})\s+(\d{4})$", v)
-    if m:
-        month_num = MONTH_NAMES.get(m.group(1).lower())
+    if shape == "month_name":
+        token = m.group("mn_month")
+        month_num = _MONTH_LOOKUP.get(token) or MONTH_NAMES.get(token.lower())
         if month_num:
             try:
-                return _fmt(datetime(int(m.group(3)), month_num, int(m.group(2)))), True, \
+                return _fmt(datetime(int(m.group("mn_y")), month_num, int(m.group("mn_day")))), True, \
                        "Written-out month name normalised to ISO YYYY-MM-DD"
             except ValueError:
                 pass
         return v, False, ""
 
     # Unix timestamp (10 digits)
-    if re.match(r"^\d{10}$", v):
+    if shape == "unix":
         try:
             dt = datetime.fromtimestamp(int(v), tz=timezone.utc)
             return _fmt(dt), True, "Unix timestamp (UTC) converted to YYYY-MM-DD"
@@ -186,7 +280,7 @@ def normalise_date(value: str) -> tuple[str, bool, str]:
             return v, False, ""
 
     # Excel serial date (5-digit integer in plausible range)
-    if re.match(r"^\d{5}$", v) and 40_000 <= int(v) <= 55_000:
+    if 40_000 <= int(v) <= 55_000:
         return _fmt(EXCEL_EPOCH + timedelta(days=int(v))), True, \
                "Excel serial date (Windows epoch 1899-12-30) converted to YYYY-MM-DD"
 
@@ -194,8 +288,24 @@ def normalise_date(value: str) -> tuple[str, bool, str]:
 
 
 _AMOUNT_NULL = {"n/a", "tbd", "-", "na", "nil", "none", ""}
+_CURRENCY_SYMBOL_STRIP = str.maketrans("", "", "€£¥₹$")
+_TRAILING_CODE_RE      = re.compile(r"\s*(USD|EUR|GBP|INR|CAD|AUD)\s*$", re.IGNORECASE)
+_ACCOUNTING_NEG_RE     = re.compile(r"^\(([0-9,. ]+)\)$")
+_COMMA_DECIMAL_RE      = re.compile(r",\d{2}$")
+# Already-canonical amounts ("-1234.50") come back from normalise_amount
+# unchanged. They are mostly unique on large exports, so they are recognised
+# up front rather than churning the cache. Thirteen integer digits keep the
+# float round-trip exact.
+_CANONICAL_AMOUNT_RE   = re.compile(r"-?(?:0|[1-9][0-9]{0,12})\.[0-9]{2}")
 
 def normalise_amount(value: str) -> tuple[str, bool, str]:
+    if _CANONICAL_AMOUNT_RE.fullmatch(value):
+        return value, False, "Amount normalised to 2 decimal places"
+    return _normalise_amount(value)
+
+
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
+def _normalise_amount(value: str) -> tuple[str, bool, str]:
     v = value.strip()
     orig = v
     if v.lower() in _AMOUNT_NULL:
@@ -203,11 +313,11 @@ def normalise_amount(value: str) -> tuple[str, bool, str]:
         return result, (result != orig), "Non-numeric placeholder left blank (N/A / TBD)"
 
     # Strip currency symbols and trailing ISO codes
-    v = re.sub(r"[€£¥₹$]", "", v)
-    v = re.sub(r"\s*(USD|EUR|GBP|INR|CAD|AUD)\s*$", "", v, flags=re.IGNORECASE).strip()
+    v = v.translate(_CURRENCY_SYMBOL_STRIP)
+    v = _TRAILING_CODE_RE.sub("", v).strip()
 
     # Negative accounting notation: (500) → -500
-    m = re.match(r"^\(([0-9,. ]+)\)$", v)
+    m = _ACCOUNTING_NEG_RE.match(v)
     if m:
         v = "-" + m.group(1)
 
@@ -220,7 +330,7 @@ def normalise_amount(value: str) -> tuple[str, bool, str]:
             v = v.replace(",", "")
             desc = "US thousands separator removed"
     elif "," in v:
-        if re.search(r",\d{2}$", v):
+        if _COMMA_DECIMAL_RE.search(v):
             v = v.replace(",", ".")
             desc = "Comma decimal separator converted to period"
         else:
@@ -245,16 +355,23 @@ CURRENCY_MAP = {
     "aud": "AUD", "australian dollar": "AUD",
 }
 
+_ISO_CURRENCY_RE = re.compile(r"^[A-Z]{3}$")
+# Symbols dropped before the CURRENCY_MAP lookup; ¥ has no mapping, so it stays
+_CURRENCY_MARKER_STRIP = str.maketrans("", "", "₹€$£")
+
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
 def normalise_currency(value: str) -> tuple[str, bool, str]:
     v = value.strip()
     if not v:
         return v, False, ""
-    cleaned = v.replace("₹", "").replace("€", "").replace("$", "").replace("£", "").strip()
-    for lookup in (cleaned.lower(), v.lower()):
-        if lookup in CURRENCY_MAP:
-            result = CURRENCY_MAP[lookup]
-            return result, result != v, f"Currency '{v}' standardised to ISO 3-letter code"
-    if re.match(r"^[A-Z]{3}$", cleaned):
+    cleaned = v.translate(_CURRENCY_MARKER_STRIP).strip()
+    result = CURRENCY_MAP.get(cleaned.lower())
+    if result is None and cleaned != v:
+        # Symbols on their own ("$", "€") only map before stripping
+        result = CURRENCY_MAP.get(v.lower())
+    if result is not None:
+        return result, result != v, f"Currency '{v}' standardised to ISO 3-letter code"
+    if _ISO_CURRENCY_RE.match(cleaned):
         return cleaned, cleaned != v, "Currency uppercased to ISO format"
     return v, False, ""
 
@@ -264,11 +381,12 @@ def split_amount_currency_fields(row: list[str], row_num: int) -> tuple[list[str
         row,
         row_num,
         HEADERS,
-        COL["Amount"],
-        COL["Currency"],
+        _AMOUNT_IDX,
+        _CURRENCY_IDX,
     )
 
 
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
 def normalise_name(value: str) -> tuple[str, bool, str]:
     v = " ".join(value.split())   # collapse multiple spaces
     if not v:
@@ -300,6 +418,7 @@ STATUS_MAP = {
     "pending review": "Pending",
 }
 
+@lru_cache(maxsize=_NORMALISER_CACHE_SIZE)
 def normalise_status(value: str) -> tuple[str, bool, str]:
     v = value.strip()
     result = STATUS_MAP.get(v.lower(), v.title() if v else v)
@@ -307,6 +426,20 @@ def normalise_status(value: str) -> tuple[str, bool, str]:
     return result, result != v, reason
 
 
+_FIELD_NORMALISERS = (
+    (COL["Date"],          normalise_date,     "Date"),
+    (COL["Amount"],        normalise_amount,   "Amount"),
+    (COL["Currency"],      normalise_currency, "Currency"),
+    (COL["Employee Name"], normalise_name,     "Employee Name"),
+    (COL["Status"],        normalise_status,   "Status"),
+)
+
+_LOW_CARDINALITY_COLS = (COL["Department"], COL["Currency"], COL["Category"], COL["Status"])
+
+# Per-row column slots, resolved once instead of hashing COL keys on every row
+_DEPT_IDX, _CATEGORY_IDX = COL["Department"], COL["Category"]
+_AMOUNT_IDX, _CURRENCY_IDX, _DATE_IDX = COL["Amount"], COL["Currency"], COL["Date"]
+
 def apply_normalisations(row: list[str], row_num: int) -> tuple[list[str], list[Change]]:
     row     = row.copy()
     changes = []
@@ -314,35 +447,35 @@ def apply_normalisations(row: list[str], row_num: int) -> tuple[list[str], list[
     row, split_changes = split_amount_currency_fields(row, row_num)
     changes.extend(split_changes)
 
-    def maybe_fix(idx, fn, col_label):
+    for idx, fn, col_label in _FIELD_NORMALISERS:
         orig = row[idx]
         new, changed, reason = fn(orig)
         if changed:
             row[idx] = new
-            changes.append(Change(row_num, col_label, orig, new, "Fixed", reason))
-
-    maybe_fix(COL["Date"],          normalise_date,     "Date")
-    maybe_fix(COL["Amount"],        normalise_amount,   "Amount")
-    maybe_fix(COL["Currency"],      normalise_currency, "Currency")
-    maybe_fix(COL["Employee Name"], normalise_name,     "Employee Name")
-    maybe_fix(COL["Status"],        normalise_status,   "Status")
+            # Reasons come from a handful of templates; interning lets every
+            # matching change-log entry share one string.
+            changes.append(Change(row_num, col_label, orig, new, "Fixed", sys.intern(reason)))
 
     # Department — title-case + collapse whitespace
-    orig = row[COL["Department"]]
+    orig = row[_DEPT_IDX]
     fixed_dept = " ".join(orig.split()).title()
     if fixed_dept != orig:
-        row[COL["Department"]] = fixed_dept
+        row[_DEPT_IDX] = fixed_dept
         changes.append(Change(row_num, "Department", orig, fixed_dept,
                                "Fixed", "Department title-cased"))
 
     # Category — title-case
-    orig = row[COL["Category"]]
+    orig = row[_CATEGORY_IDX]
     fixed_cat = orig.strip().title()
     if fixed_cat != orig:
-        row[COL["Category"]] = fixed_cat
+        row[_CATEGORY_IDX] = fixed_cat
         changes.append(Change(row_num, "Category", orig, fixed_cat,
                                "Fixed", "Category title-cased"))
 
+    # A few dozen distinct values repeat down these columns; share one string each
+    for idx in _LOW_CARDINALITY_COLS:
+        row[idx] = sys.intern(row[idx])
+
     return row, changes
 
 
@@ -352,10 +485,10 @@ def apply_normalisations(row: list[str], row_num: int) -> tuple[list[str], list[
 
 def needs_review(row: list[str], was_padded: bool) -> bool:
     """Row needs human review if: amount blank, date unparseable, or padded."""
-    if not row[COL["Amount"]]:
+    if not row[_AMOUNT_IDX]:
         return True
-    date_val = row[COL["Date"]]
-    if date_val and not re.match(r"^\d{4}-\d{2}-\d{2}$", date_val):
+    date_val = row[_DATE_IDX]
+    if date_val and not _ISO_DATE_RE.match(date_val):
         return True
     return was_padded
 
@@ -390,7 +523,6 @@ def forward_fill_merged_cell_gaps_generic(
 
         for idx, entry in enumerate(clean_data):
             cell_value = entry.row[col_idx].strip()
-            other_filled = sum(1 for j, cell in enumerate(entry.row) if j != col_idx and cell.strip())
 
             if cell_value:
                 if last_value and gap_indexes and len(gap_indexes) <= 5:
@@ -399,7 +531,9 @@ def forward_fill_merged_cell_gaps_generic(
                 gap_indexes = []
                 continue
 
-            if last_value and other_filled >= 2:
+            # Only blank cells need the rest of the row counted, and since this
+            # cell is blank every filled cell belongs to another column
+            if last_value and sum(1 for cell in entry.row if cell.strip()) >= 2:
                 gap_indexes.append(idx)
             else:
                 gap_indexes = []
@@ -421,7 +555,8 @@ def split_amount_currency_fields_dynamic(
     if amount_idx is None or currency_idx is None:
         return row, []
 
-    row = row.copy()
+    # Copy on first write: most rows need no recovery and come back as-is
+    original_row = row
     changes: list[Change] = []
     amount_label = headers[amount_idx]
     currency_label = headers[currency_idx]
@@ -429,8 +564,13 @@ def split_amount_currency_fields_dynamic(
     amount_val = row[amount_idx]
     currency_val = row[currency_idx]
 
-    extracted_amount, extracted_currency = extract_currency_from_text(amount_val)
-    if extracted_currency and (not currency_val.strip()):
+    # Recovery only applies to a blank currency cell, so filled rows (the
+    # usual case) never pay for scanning the amount text
+    extracted_amount, extracted_currency = (
+        extract_currency_from_text(amount_val) if not currency_val.strip() else (None, None)
+    )
+    if extracted_currency:
+        row = row.copy()
         if extracted_amount and extracted_amount != amount_val:
             row[amount_idx] = extracted_amount
             changes.append(
@@ -460,6 +600,8 @@ def split_amount_currency_fields_dynamic(
     if not row[amount_idx].strip() and currency_val.strip():
         extracted_amount, extracted_currency = extract_currency_from_text(currency_val)
         if extracted_amount:
+            if row is original_row:
+                row = row.copy()
             original_currency = row[currency_idx]
             row[amount_idx] = extracted_amount
             changes.append(
@@ -488,6 +630,46 @@ def split_amount_currency_fields_dynamic(
     return row, changes
 
 
+def _collapse_spaces(value: str) -> str:
+    return " ".join(value.split()) if value.strip() else ""
+
+
+def _normalise_identifier(value: str) -> tuple[str, bool, str]:
+    new_value = _collapse_spaces(value)
+    return new_value, new_value != value, "Identifier spacing normalised"
+
+
+def _normalise_measurement(value: str) -> tuple[str, bool, str]:
+    new_value = _collapse_spaces(value)
+    return new_value, new_value != value, "Measurement text spacing normalised"
+
+
+def _normalise_department(value: str) -> tuple[str, bool, str]:
+    new_value = _collapse_spaces(value).title()
+    return new_value, new_value != value, "Department title-cased"
+
+
+def _normalise_category(value: str) -> tuple[str, bool, str]:
+    new_value = _collapse_spaces(value).title()
+    return new_value, new_value != value, "Category title-cased"
+
+
+# Semantic role → cell normaliser, resolved once per column instead of
+# walking an if/elif chain for every cell.
+_SEMANTIC_NORMALISERS = {
+    "date":        normalise_date,
+    "amount":      normalise_amount,
+    "identifier":  _normalise_identifier,
+    "measurement": _normalise_measurement,
+    "currency":    normalise_currency,
+    "name":        normalise_name,
+    "status":      normalise_status,
+    "department":  _normalise_department,
+    "category":    _normalise_category,
+}
+_LOW_CARDINALITY_ROLES = frozenset({"currency", "status", "department", "category"})
+
+
 def apply_semantic_normalisations(
     row: list[str], row_num: int, headers: list[str], semantic_plan: SemanticPlan
 ) -> tuple[list[str], list[Change]]:
@@ -500,38 +682,32 @@ def apply_semantic_normalisations(
     changes.extend(split_changes)
 
     for idx, role in semantic_plan.roles_by_index.items():
-        original = row[idx]
-        if role == "date":
-            new_value, changed, reason = normalise_date(original)
-        elif role == "amount":
-            new_value, changed, reason = normalise_amount(original)
-        elif role == "identifier":
-            new_value = " ".join(original.split()) if original.strip() else ""
-            changed = new_value != original
-            reason = "Identifier spacing normalised"
-        elif role == "measurement":
-            new_value = " ".join(original.split()) if original.strip() else ""
-            changed = new_value != original
-            reason = "Measurement text spacing normalised"
-        elif role == "currency":
-            new_value, changed, reason = normalise_currency(original)
-        elif role == "name":
-            new_value, changed, reason = normalise_name(original)
-        elif role == "status":
-            new_value, changed, reason = normalise_status(original)
-        elif role in {"department", "category"}:
-            new_value = " ".join(original.split()).title() if original.strip() else ""
-            changed = new_value != original
-            reason = f"{role.title()} title-cased"
-        else:
+        normaliser = _SEMANTIC_NORMALISERS.get(role)
+        if normaliser is None:
             continue
-
+        original = row[idx]
+        new_value, changed, reason = normaliser(original)
         if changed:
             row[idx] = new_value
-            changes.append(Change(row_num, headers[idx], original, new_value, "Fixed", reason))
+            changes.append(Change(row_num, headers[idx], original, new_value, "Fixed", sys.intern(reason)))
+        if role in _LOW_CARDINALITY_ROLES:
+            row[idx] = sys.intern(row[idx])
 
     return row, changes
 
+_REVIEW_TOKENS = frozenset({"nan", "null", "n/a", "na", "not applicable", "none", "inf"})
+# str.lower() never shortens a string, so longer cells cannot be a token
+_MAX_REVIEW_TOKEN_LEN = max(map(len, _REVIEW_TOKENS))
+
+
+def _has_review_token(row: list[str]) -> bool:
+    for cell in row:
+        value = cell.strip()
+        if value and len(value) <= _MAX_REVIEW_TOKEN_LEN and value.lower() in _REVIEW_TOKENS:
+            return True
+    return False
+
+
 def needs_review_semantic(row: list[str], structure_changed: bool, semantic_plan: SemanticPlan) -> bool:
     if structure_changed:
         return True
@@ -539,14 +715,12 @@ def needs_review_semantic(row: list[str], structure_changed: bool, semantic_plan
         return True
     if semantic_plan.date_idx is not None:
         date_value = row[semantic_plan.date_idx].strip()
-        if date_value and not re.match(r"^\d{4}-\d{2}-\d{2}$", date_value):
+        if date_value and not _ISO_DATE_RE.match(date_value):
             return True
-    review_tokens = {"nan", "null", "n/a", "na", "not applicable", "none", "inf"}
-    return any(cell.strip().lower() in review_tokens for cell in row if cell.strip())
+    return _has_review_token(row)
 
 
 def needs_review_generic(row: list[str], structure_changed: bool) -> bool:
     if structure_changed:
         return True
-    review_tokens = {"nan", "null", "n/a", "na", "not applicable", "none", "inf"}
-    return any(cell.strip().lower() in review_tokens for cell in row if cell.strip())
+    return _has_review_token(row)
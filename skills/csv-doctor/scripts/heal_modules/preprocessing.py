@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import csv
 import io
+import math
 import re
+import sys
 from collections import Counter
 from pathlib import Path
 
@@ -26,12 +28,19 @@ from heal_modules.shared import (
     is_schema_specific_header,
 )
 from heal_modules.normalization import (
+    _ISO_DATE_RE,
     _clean_cell_text,
+    _stripped_if_clean,
     extract_currency_from_text,
     normalise_date,
     parse_amount_like,
 )
 
+_ALPHA_RE          = re.compile(r"[A-Za-z]")
+_NUMERIC_HEAVY_RE  = re.compile(r"[\d,./:-]+")
+_WORDY_RE          = re.compile(r"[A-Za-z]{4,}")
+_GENERIC_TOTAL_RE  = re.compile(r"^(grand\s+total|subtotal|total)\b", re.IGNORECASE)
+
 def _non_empty_cells(row: list[str]) -> list[str]:
     cells = []
     for cell in row:
@@ -58,7 +67,7 @@ def _looks_like_header_row(row: list[str]) -> bool:
         return False
     data_like_cells = 0
     for cell in non_empty:
-        lower_cell = cell.strip().lower()
+        lower_cell = cell.lower()   # non_empty cells are already stripped
         if parse_amount_like(cell) is not None:
             data_like_cells += 1
             continue
@@ -67,15 +76,15 @@ def _looks_like_header_row(row: list[str]) -> bool:
             data_like_cells += 1
             continue
         normalized_date, changed, _ = normalise_date(cell)
-        if changed or re.match(r"^\d{4}-\d{2}-\d{2}$", normalized_date):
+        if changed or _ISO_DATE_RE.match(normalized_date):
             data_like_cells += 1
             continue
         if lower_cell in STATUS_VALUE_HINTS:
             data_like_cells += 1
     if data_like_cells >= 2:
         return False
-    alpha_cells = sum(1 for cell in non_empty if re.search(r"[A-Za-z]", cell))
-    numeric_heavy = sum(1 for cell in non_empty if re.fullmatch(r"[\d,./:-]+", cell))
+    alpha_cells = sum(1 for cell in non_empty if _ALPHA_RE.search(cell))
+    numeric_heavy = sum(1 for cell in non_empty if _NUMERIC_HEAVY_RE.fullmatch(cell))
     return alpha_cells >= max(2, len(non_empty) - 1) and numeric_heavy <= 1
 
 
@@ -121,10 +130,17 @@ def detect_header_row_index(all_rows: list[list[str]], explicit_header_row: int
         if idx < len(all_rows) - 1 and _looks_like_header_row(row)
     ]
     if generic_candidates:
+        # Adjacent candidates share rows, so score each row once
+        signals: dict[int, int] = {}
+
+        def signal_count(idx: int) -> int:
+            if idx not in signals:
+                signals[idx] = _row_data_signal_count(all_rows[idx])
+            return signals[idx]
+
         signal_candidates = [
             idx for idx in generic_candidates
-            if _row_data_signal_count(all_rows[idx + 1]) > _row_data_signal_count(all_rows[idx])
-            and _row_data_signal_count(all_rows[idx + 1]) > 0
+            if signal_count(idx + 1) > signal_count(idx) and signal_count(idx + 1) > 0
         ]
         if signal_candidates:
             return signal_candidates[-1]
@@ -296,6 +312,14 @@ def is_formula_residue(value: str) -> bool:
     return bool(FORMULA_RE.match(_strip_nulls(value).strip()))
 
 
+def _stripped_cell_is_formula(cell: str) -> bool:
+    # An already-stripped cell can only hide a formula behind null bytes;
+    # otherwise the leading character decides without the regex.
+    if "\x00" in cell:
+        return is_formula_residue(cell)
+    return cell[:1] == "="
+
+
 def detect_formula_row(row: list[str], headers: list[str]) -> tuple[bool, str]:
     for idx, cell in enumerate(row):
         if is_formula_residue(cell):
@@ -313,7 +337,7 @@ def looks_like_notes_row(row: list[str]) -> bool:
         return False
     if len(text.split()) < 8:
         return False
-    return bool(NOTES_ROW_RE.search(text) or re.search(r"[A-Za-z]{4,}", text))
+    return bool(NOTES_ROW_RE.search(text) or _WORDY_RE.search(text))
 
 
 def row_amount_totalish(label_cell: str, amount_cell: str, running_total: float) -> bool:
@@ -355,9 +379,11 @@ def read_file(
     delimiter = result["delimiter"]
 
     if raw_text is not None and delimiter is not None:
-        # Text format: re-parse with csv.reader so multi-line quoted fields
-        # are reconstructed correctly (same behaviour as the old read_mixed_encoding).
-        rows = list(csv.reader(io.StringIO(raw_text), delimiter=delimiter))
+        # Text format: the loader has already run csv.reader over the decoded
+        # text (multi-line quoted fields reconstructed), so reuse its rows.
+        rows = result.get("raw_rows")
+        if rows is None:
+            rows = list(csv.reader(io.StringIO(raw_text), delimiter=delimiter))
     else:
         # Structured/binary formats: preserve actual workbook rows for healing.
         # Reconstructing from DataFrame headers loses workbook preambles and
@@ -385,10 +411,8 @@ def read_file(
             # JSON and other structured formats do not have workbook-style preambles,
             # so DataFrame reconstruction remains acceptable here.
             df = result["dataframe"]
-            rows = [list(df.columns)] + [
-                [str(v) if v is not None else "" for v in row]
-                for row in df.itertuples(index=False, name=None)
-            ]
+            values = df.astype(object).where(df.notna(), "").astype(str)
+            rows = [list(df.columns)] + values.to_numpy().tolist()
 
     return rows, delimiter or ","
 
@@ -481,28 +505,39 @@ QUARANTINE_REASONS = {
     "SPARSE":              f"Less than {int(SPARSE_THRESHOLD_SCHEMA * 100)}% columns filled",
 }
 
+# Filled-cell counts are whole numbers, so "< N_COLS * threshold" is the same
+# test as "< ceil(N_COLS * threshold)" and can stay an int comparison.
+_SCHEMA_SPARSE_MIN = math.ceil(N_COLS * SPARSE_THRESHOLD_SCHEMA)
+_AMOUNT_IDX = COL["Amount"]
+
 def classify_raw_row(row: list[str], header_sig: tuple[str, ...]) -> str:
     stripped = [c.strip() for c in row]
+    non_empty = len(stripped) - stripped.count("")   # one C-level pass
 
-    if all(c == "" for c in stripped):
+    if not non_empty:
         # Distinguish truly empty (all "") from whitespace-only
         return "WHITESPACE" if any(c != "" for c in row) else "EMPTY"
 
-    if tuple(c.lower() for c in stripped) == header_sig:
-        return "STRUCTURAL_HEADER"
+    if len(stripped) == len(header_sig) and stripped[0].lower() == header_sig[0]:
+        if all(c.lower() == h for c, h in zip(stripped, header_sig)):
+            return "STRUCTURAL_HEADER"
 
-    if looks_like_notes_row(row):
+    # One joined copy of the stripped cells gates the per-cell checks below:
+    # without a null byte the notes check needs exactly one filled cell, and
+    # a formula needs an "=" somewhere.
+    joined = "".join(stripped)
+
+    if (non_empty == 1 or "\x00" in joined) and looks_like_notes_row(row):
         return "NOTES_ROW"
 
-    if any(is_formula_residue(cell) for cell in stripped):
+    if "=" in joined and any(_stripped_cell_is_formula(cell) for cell in stripped):
         return "FORMULA"
 
-    if TOTAL_LABEL_RE.search(stripped[0]) and len(stripped) > COL["Amount"]:
-        if parse_amount_like(stripped[COL["Amount"]]) is not None:
+    if TOTAL_LABEL_RE.search(stripped[0]) and len(stripped) > _AMOUNT_IDX:
+        if parse_amount_like(stripped[_AMOUNT_IDX]) is not None:
             return "NORMAL"
 
-    non_empty = sum(1 for c in stripped if c)
-    if non_empty < N_COLS * SPARSE_THRESHOLD_SCHEMA:
+    if non_empty < _SCHEMA_SPARSE_MIN:
         return "SPARSE"
 
     return "NORMAL"
@@ -513,7 +548,11 @@ def classify_raw_row(row: list[str], header_sig: tuple[str, ...]) -> str:
 # ══════════════════════════════════════════════════════════════════════════
 
 def fix_alignment(row: list[str], row_num: int) -> tuple[list[str], Change | None]:
-    """Detect and fix three structural column problems."""
+    """Detect and fix three structural column problems.
+
+    Column-count descriptions repeat across many rows, so they are interned
+    and the change log shares one string per distinct value.
+    """
     n = len(row)
     if n == N_COLS:
         return row, None
@@ -524,8 +563,8 @@ def fix_alignment(row: list[str], row_num: int) -> tuple[list[str], Change | Non
             fixed = row[1: N_COLS + 1]
             return fixed, Change(
                 row_num, "[row structure]",
-                f"{n} columns (empty leading ghost col)",
-                f"{N_COLS} columns",
+                sys.intern(f"{n} columns (empty leading ghost col)"),
+                sys.intern(f"{N_COLS} columns"),
                 "Fixed", "Shifted-right row: empty leading column stripped"
             )
         # Phantom comma: empty ghost field sits between Status and Notes
@@ -551,9 +590,9 @@ def fix_alignment(row: list[str], row_num: int) -> tuple[list[str], Change | Non
     fixed = row + [""] * (N_COLS - n)
     return fixed, Change(
         row_num, "[row structure]",
-        f"{n} columns",
-        f"{N_COLS} columns ({N_COLS - n} empty field(s) appended)",
-        "Fixed", f"Short row padded with {N_COLS - n} empty field(s)"
+        sys.intern(f"{n} columns"),
+        sys.intern(f"{N_COLS} columns ({N_COLS - n} empty field(s) appended)"),
+        "Fixed", sys.intern(f"Short row padded with {N_COLS - n} empty field(s)")
     )
 
 GENERIC_QUARANTINE_REASONS = {
@@ -602,23 +641,29 @@ def normalise_headers_generic(raw_header: list[str]) -> tuple[list[str], list[Ch
 
 def classify_raw_row_generic(row: list[str], header_sig: tuple[str, ...], n_cols: int) -> str:
     stripped = [c.strip() for c in row]
+    non_empty = len(stripped) - stripped.count("")   # one C-level pass
 
-    if all(c == "" for c in stripped):
+    if not non_empty:
         return "WHITESPACE" if any(c != "" for c in row) else "EMPTY"
 
-    if tuple(c.lower() for c in stripped) == header_sig:
-        return "STRUCTURAL_HEADER"
+    if len(stripped) == len(header_sig) and stripped[0].lower() == header_sig[0]:
+        if all(c.lower() == h for c, h in zip(stripped, header_sig)):
+            return "STRUCTURAL_HEADER"
 
-    if looks_like_notes_row(row):
+    # One joined copy of the stripped cells gates the per-cell checks below:
+    # without a null byte the notes check needs exactly one filled cell, and
+    # a formula needs an "=" somewhere.
+    joined = "".join(stripped)
+
+    if (non_empty == 1 or "\x00" in joined) and looks_like_notes_row(row):
         return "NOTES_ROW"
 
-    if any(is_formula_residue(cell) for cell in stripped):
+    if "=" in joined and any(_stripped_cell_is_formula(cell) for cell in stripped):
         return "FORMULA"
 
     first_non_empty = next((c for c in stripped if c), "")
-    non_empty = sum(1 for c in stripped if c)
 
-    if re.match(r"^(grand\s+total|subtotal|total)\b", first_non_empty, flags=re.IGNORECASE):
+    if _GENERIC_TOTAL_RE.match(first_non_empty):
         if non_empty <= max(2, n_cols // 3):
             return "STRUCTURAL_TOTAL"
 
@@ -641,26 +686,30 @@ def fix_alignment_generic(
         return fixed, Change(
             row_num,
             "[row structure]",
-            f"{n} columns",
-            f"{n_cols} columns",
+            sys.intern(f"{n} columns"),
+            sys.intern(f"{n_cols} columns"),
             "Fixed",
-            f"Overflow columns merged into last column using delimiter '{delimiter}'",
+            sys.intern(f"Overflow columns merged into last column using delimiter '{delimiter}'"),
         ), True
 
     fixed = row + [""] * (n_cols - n)
     return fixed, Change(
         row_num,
         "[row structure]",
-        f"{n} columns",
-        f"{n_cols} columns ({n_cols - n} empty field(s) appended)",
+        sys.intern(f"{n} columns"),
+        sys.intern(f"{n_cols} columns ({n_cols - n} empty field(s) appended)"),
         "Fixed",
-        f"Short row padded with {n_cols - n} empty field(s)",
+        sys.intern(f"Short row padded with {n_cols - n} empty field(s)"),
     ), True
 
 
 def clean_row_generic(
     row: list[str], row_num: int, headers: list[str]
 ) -> tuple[list[str], list[Change]]:
+    stripped = _stripped_if_clean(row)
+    if stripped is not None:
+        return stripped, []
+
     cleaned = []
     changes: list[Change] = []
 
@@ -671,7 +720,7 @@ def clean_row_generic(
             col_label = headers[i] if i < len(headers) else f"[col {i + 1}]"
             orig_display = original.replace("\ufeff", "[BOM]").replace("\x00", "[NULL]")
             changes.append(
-                Change(row_num, col_label, orig_display, new_val, "Fixed", "; ".join(reasons))
+                Change(row_num, col_label, orig_display, new_val, "Fixed", sys.intern("; ".join(reasons)))
             )
         cleaned.append(new_val)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from collections import Counter
-from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import pandas as pd
@@ -14,6 +14,7 @@ from heal_modules.normalization import (
     clean_row,
     forward_fill_merged_cell_gaps,
     forward_fill_merged_cell_gaps_generic,
+    iso_day_gap,
     needs_review,
     needs_review_generic,
     needs_review_semantic,
@@ -76,49 +77,37 @@ def flag_near_duplicates_semantic(
     if len(key_indices) < 2:
         return
 
-    nd_index: dict[tuple[str, ...], int] = {}
-    for idx, entry in enumerate(clean_data):
-        row = entry.row
-        key = tuple(row[i] for i in key_indices)
-        if key in nd_index:
-            prev = clean_data[nd_index[key]]
-            d1 = prev.row[semantic_plan.date_idx]
-            d2 = entry.row[semantic_plan.date_idx]
-            if (
-                d1
-                and d2
-                and re.match(r"^\d{4}-\d{2}-\d{2}$", d1)
-                and re.match(r"^\d{4}-\d{2}-\d{2}$", d2)
-            ):
-                try:
-                    delta = abs(
-                        (
-                            datetime.strptime(d2, "%Y-%m-%d")
-                            - datetime.strptime(d1, "%Y-%m-%d")
-                        ).days
-                    )
-                except ValueError:
-                    continue
-                if delta <= 2:
-                    prev.needs_review = True
-                    entry.needs_review = True
-                    label_idx = semantic_plan.label_idx
-                    for flagged, other_date, other_row_num in [
-                        (entry, d1, prev.row_num),
-                        (prev, d2, entry.row_num),
-                    ]:
-                        changelog.append(
-                            Change(
-                                flagged.row_num,
-                                "[row]",
-                                flagged.row[label_idx] if label_idx < len(flagged.row) else "",
-                                "",
-                                "Flagged",
-                                f"Near-duplicate: same semantic key columns; date {flagged.row[semantic_plan.date_idx]} differs by {delta} day(s) from row {other_row_num} ({other_date})",
-                            )
+    # At least two key columns, so itemgetter always hands back a tuple
+    nd_key = itemgetter(*key_indices)
+    date_idx = semantic_plan.date_idx
+    nd_index: dict[tuple[str, ...], CleanRow] = {}
+    for entry in clean_data:
+        key = nd_key(entry.row)
+        prev = nd_index.get(key)
+        if prev is not None:
+            d1 = prev.row[date_idx]
+            d2 = entry.row[date_idx]
+            delta = iso_day_gap(d1, d2)
+            if delta is not None and delta <= 2:
+                prev.needs_review = True
+                entry.needs_review = True
+                label_idx = semantic_plan.label_idx
+                for flagged, other_date, other_row_num in [
+                    (entry, d1, prev.row_num),
+                    (prev, d2, entry.row_num),
+                ]:
+                    changelog.append(
+                        Change(
+                            flagged.row_num,
+                            "[row]",
+                            flagged.row[label_idx] if label_idx < len(flagged.row) else "",
+                            "",
+                            "Flagged",
+                            f"Near-duplicate: same semantic key columns; date {flagged.row[date_idx]} differs by {delta} day(s) from row {other_row_num} ({other_date})",
                         )
+                    )
         else:
-            nd_index[key] = idx
+            nd_index[key] = entry
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -136,6 +125,9 @@ def process_schema_specific(
     changelog:  list[Change]         = list(initial_changelog or [])
     seen_exact: dict[tuple, int]     = {}   # normalized row → original row_num
     running_amount_total = 0.0
+    # COL never changes; resolve the per-row lookups once
+    name_idx, dept_idx = COL["Employee Name"], COL["Department"]
+    category_idx, amount_idx = COL["Category"], COL["Amount"]
 
     # Skip row 0 (actual column headers); start from row 1 (metadata / first data row)
     data_rows = all_rows[1:]
@@ -167,25 +159,29 @@ def process_schema_specific(
         # ── Fix alignment ─────────────────────────────────────────────────
         aligned, align_chg = fix_alignment(raw_row, row_num)
         was_padded = align_chg is not None and "padded" in align_chg.reason.lower()
-        if align_chg:
-            changelog.append(align_chg)
 
         # ── Clean cells ───────────────────────────────────────────────────
         cleaned, cell_chgs = clean_row(aligned, row_num)
-        changelog.extend(cell_chgs)
 
         # ── Normalise values ──────────────────────────────────────────────
         fixed, norm_chgs = apply_normalisations(cleaned, row_num)
-        changelog.extend(norm_chgs)
 
-        label_cell = fixed[COL["Employee Name"]] or fixed[COL["Department"]] or fixed[COL["Category"]]
-        if row_amount_totalish(label_cell, fixed[COL["Amount"]], running_amount_total) or sparse_total_label_row(fixed, COL["Employee Name"], COL["Amount"]):
+        # Log this row's fixes in one step; most rows have none
+        was_modified = bool(align_chg or cell_chgs or norm_chgs)
+        if was_modified:
+            if align_chg:
+                changelog.append(align_chg)
+            changelog += cell_chgs
+            changelog += norm_chgs
+
+        label_cell = fixed[name_idx] or fixed[dept_idx] or fixed[category_idx]
+        if row_amount_totalish(label_cell, fixed[amount_idx], running_amount_total) or sparse_total_label_row(fixed, name_idx, amount_idx):
             quarantine.append(QuarantineRow(fixed, row_num, QUARANTINE_REASONS["CALCULATED_SUBTOTAL"]))
             changelog.append(
                 Change(
                     row_num,
                     "Amount",
-                    fixed[COL["Amount"]],
+                    fixed[amount_idx],
                     "",
                     "Quarantined",
                     "Calculated subtotal row",
@@ -193,8 +189,6 @@ def process_schema_specific(
             )
             continue
 
-        was_modified = bool(align_chg or cell_chgs or norm_chgs)
-
         # ── Exact-duplicate removal ───────────────────────────────────────
         row_key = tuple(fixed)
         if row_key in seen_exact:
@@ -212,7 +206,7 @@ def process_schema_specific(
             was_modified = was_modified,
             needs_review = needs_review(fixed, was_padded),
         ))
-        parsed_amount = parse_amount_like(fixed[COL["Amount"]])
+        parsed_amount = parse_amount_like(fixed[amount_idx])
         if parsed_amount is not None:
             running_amount_total += parsed_amount
 
@@ -221,50 +215,54 @@ def process_schema_specific(
         forward_fill_merged_cell_gaps(clean_data, changelog)
 
         # ── Near-duplicate detection (second pass on clean_data) ─────────────
-        nd_index: dict[tuple, int] = {}   # key → index in clean_data
-        for idx, entry in enumerate(clean_data):
-            r = entry.row
-            key = (r[COL["Employee Name"]], r[COL["Amount"]],
-                   r[COL["Currency"]],     r[COL["Category"]])
-            if key in nd_index:
-                j       = nd_index[key]
-                prev    = clean_data[j]
-                d1, d2  = prev.row[COL["Date"]], entry.row[COL["Date"]]
-                if (d1 and d2
-                        and re.match(r"^\d{4}-\d{2}-\d{2}$", d1)
-                        and re.match(r"^\d{4}-\d{2}-\d{2}$", d2)):
-                    try:
-                        delta = abs((datetime.strptime(d2, "%Y-%m-%d")
-                                     - datetime.strptime(d1, "%Y-%m-%d")).days)
-                        if delta <= 2:
-                            prev.needs_review  = True
-                            entry.needs_review = True
-                            for flagged, other_date, other_row_num in [
-                                (entry, d1, prev.row_num),
-                                (prev,  d2, entry.row_num),
-                            ]:
-                                changelog.append(Change(
-                                    flagged.row_num, "[row]",
-                                    flagged.row[COL["Employee Name"]], "",
-                                    "Flagged",
-                                    f"Near-duplicate: same Name/Amount/Currency/Category; "
-                                    f"date {flagged.row[COL['Date']]} differs by {delta} day(s) "
-                                    f"from row {other_row_num} ({other_date})"
-                                ))
-                    except ValueError:
-                        pass
+        # This runs after the forward fill on purpose: the fill can rewrite
+        # Currency/Category, which are part of the key.
+        nd_key   = itemgetter(name_idx, amount_idx, COL["Currency"], category_idx)
+        date_idx = COL["Date"]
+        nd_index: dict[tuple, CleanRow] = {}   # key → first clean row with it
+        for entry in clean_data:
+            key = nd_key(entry.row)
+            prev = nd_index.get(key)
+            if prev is not None:
+                d1, d2  = prev.row[date_idx], entry.row[date_idx]
+                delta = iso_day_gap(d1, d2)
+                if delta is not None and delta <= 2:
+                    prev.needs_review  = True
+                    entry.needs_review = True
+                    for flagged, other_date, other_row_num in [
+                        (entry, d1, prev.row_num),
+                        (prev,  d2, entry.row_num),
+                    ]:
+                        changelog.append(Change(
+                            flagged.row_num, "[row]",
+                            flagged.row[name_idx], "",
+                            "Flagged",
+                            f"Near-duplicate: same Name/Amount/Currency/Category; "
+                            f"date {flagged.row[date_idx]} differs by {delta} day(s) "
+                            f"from row {other_row_num} ({other_date})"
+                        ))
             else:
-                nd_index[key] = idx
+                nd_index[key] = entry
 
     return clean_data, quarantine, changelog
 
+_HEADER_TEXT_SEP_RE = re.compile(r"[^a-z0-9]+")
+_ID_HEADER_RE = re.compile(r"\b(id|code)\b")
+_NAME_HEADER_RE = re.compile(r"\bname\b")
+_DEPARTMENT_HEADER_RE = re.compile(r"\b(ward|clinic|division|department|dept|team|unit|function|location)\b")
+_DATE_PART_HEADER_RE = re.compile(r"\b(month|day|year)\b")
+_DATE_HEADER_RE = re.compile(r"\b(date|dob|dofb)\b")
+
 def _header_text(header: str) -> str:
-    return re.sub(r"[^a-z0-9]+", " ", (header or "").strip().lower()).strip()
+    return _HEADER_TEXT_SEP_RE.sub(" ", (header or "").strip().lower()).strip()
 
 
-def _header_matches_role(header: str, role: str) -> bool:
-    lowered = _header_text(header)
-    return any(token in lowered for token in ROLE_HEADER_HINTS.get(role, ()))
+def _matched_header_roles(header_text: str) -> frozenset[str]:
+    """Roles whose header hints appear in an already-normalised *header_text*."""
+    return frozenset(
+        role for role, hints in ROLE_HEADER_HINTS.items()
+        if any(token in header_text for token in hints)
+    )
 
 
 def _status_like_column(column_stats: dict) -> bool:
@@ -286,6 +284,8 @@ def _average_sample_length(column_stats: dict) -> float:
 def _semantic_role_scores(header: str, column_stats: dict) -> dict[str, float]:
     detected_type = column_stats.get("detected_type", "unknown")
     header_text = _header_text(header)
+    # Every hint check below reads the same header; match all roles in one go
+    matched_roles = _matched_header_roles(header_text)
     scores = {
         "identifier": 0.0,
         "name": 0.0,
@@ -325,11 +325,11 @@ def _semantic_role_scores(header: str, column_stats: dict) -> dict[str, float]:
         scores["notes"] += 0.20
 
     for role in scores:
-        if _header_matches_role(header, role):
+        if role in matched_roles:
             if role == "identifier":
-                scores[role] += 0.82 if re.search(r"\b(id|code)\b", header_text) else 0.68
+                scores[role] += 0.82 if _ID_HEADER_RE.search(header_text) else 0.68
             elif role == "name":
-                scores[role] += 0.82 if re.search(r"\bname\b", header_text) else 0.68
+                scores[role] += 0.82 if _NAME_HEADER_RE.search(header_text) else 0.68
             elif role == "currency":
                 scores[role] += 0.68
             elif role in {"date", "amount"}:
@@ -337,7 +337,7 @@ def _semantic_role_scores(header: str, column_stats: dict) -> dict[str, float]:
             elif role == "measurement":
                 scores[role] += 0.72
             elif role == "department":
-                scores[role] += 0.82 if re.search(r"\b(ward|clinic|division|department|dept|team|unit|function|location)\b", header_text) else 0.68
+                scores[role] += 0.82 if _DEPARTMENT_HEADER_RE.search(header_text) else 0.68
             else:
                 scores[role] += 0.68
 
@@ -346,14 +346,13 @@ def _semantic_role_scores(header: str, column_stats: dict) -> dict[str, float]:
     if detected_type == "free text" and _average_sample_length(column_stats) >= 20:
         scores["notes"] += 0.12
 
-    if not _header_matches_role(header, "name") and any(
-        _header_matches_role(header, role_name)
-        for role_name in ("identifier", "measurement", "department", "category", "status", "date")
+    if "name" not in matched_roles and not matched_roles.isdisjoint(
+        ("identifier", "measurement", "department", "category", "status", "date")
     ):
         scores["name"] = min(scores["name"], 0.40)
-    if re.search(r"\b(month|day|year)\b", header_text) and not re.search(r"\b(date|dob|dofb)\b", header_text):
+    if _DATE_PART_HEADER_RE.search(header_text) and not _DATE_HEADER_RE.search(header_text):
         scores["date"] = min(scores["date"], 0.40)
-    if _header_matches_role(header, "measurement"):
+    if "measurement" in matched_roles:
         scores["notes"] = min(scores["notes"], 0.20)
 
     return {role: min(score, 0.99) for role, score in scores.items()}
@@ -680,16 +679,18 @@ def process_generic(
             continue
 
         aligned, align_change, structure_changed = fix_alignment_generic(raw_row, i, n_cols, delimiter)
-        if align_change:
-            changelog.append(align_change)
-
         cleaned, cell_changes = clean_row_generic(aligned, i, headers)
-        changelog.extend(cell_changes)
         semantic_changes: list[Change] = []
         if semantic_plan.enabled:
             cleaned, semantic_changes = apply_semantic_normalisations(cleaned, i, headers, semantic_plan)
-            changelog.extend(semantic_changes)
+
+        # Log this row's fixes in one step; most rows have none
         was_modified = bool(align_change or cell_changes or semantic_changes)
+        if was_modified:
+            if align_change:
+                changelog.append(align_change)
+            changelog += cell_changes
+            changelog += semantic_changes
 
         label_text = cleaned[label_idx] if label_idx < len(cleaned) else ""
         amount_text = cleaned[amount_idx] if amount_idx is not None and amount_idx < len(cleaned) else ""
@@ -780,10 +781,7 @@ def execute_healing_pipeline(
         assumptions = SEMANTIC_ASSUMPTIONS if mode == "semantic" else GENERIC_ASSUMPTIONS
 
     action_counts = Counter(c.action_taken for c in changelog)
-    quarantine_reason_counts = {
-        reason: sum(1 for q in quarantine if q.reason == reason)
-        for reason in {q.reason for q in quarantine}
-    }
+    quarantine_reason_counts = Counter(q.reason for q in quarantine)
 
     return {
         "input_path": input_path,
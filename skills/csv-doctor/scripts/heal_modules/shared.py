@@ -50,7 +50,7 @@ STATUS_MAP = {
     "pending": "Pending",
     "pending review": "Pending",
 }
-STATUS_VALUE_HINTS = set(STATUS_MAP.keys())
+STATUS_VALUE_HINTS = frozenset(STATUS_MAP)
 
 ROLE_HEADER_HINTS = {
     "identifier": ("id", "code", "study id", "study_id", "pat_id", "patient id", "subject id", "record id"),
@@ -124,8 +124,13 @@ SEMANTIC_ASSUMPTIONS = GENERIC_ASSUMPTIONS + [
 ]
 
 
+# Change/CleanRow/QuarantineRow are created per row and per fix, so they
+# declare __slots__ (no per-instance __dict__). dataclass(slots=True) needs
+# Python 3.10+, hence the explicit tuples; fields must not take defaults.
 @dataclass
 class Change:
+    __slots__ = ("original_row_number", "column_affected", "original_value",
+                 "new_value", "action_taken", "reason")
     original_row_number: int
     column_affected: str
     original_value: str
@@ -136,6 +141,7 @@ class Change:
 
 @dataclass
 class CleanRow:
+    __slots__ = ("row", "row_num", "was_modified", "needs_review")
     row: list
     row_num: int
     was_modified: bool
@@ -144,6 +150,7 @@ class CleanRow:
 
 @dataclass
 class QuarantineRow:
+    __slots__ = ("row", "row_num", "reason")
     row: list
     row_num: int
     reason: str
@@ -171,9 +178,13 @@ def _normalise_header_for_match(value: str) -> str:
     return " ".join(value.strip().lower().split())
 
 
+_EXPECTED_HEADER = tuple(_normalise_header_for_match(c) for c in HEADERS)
+
+
 def is_schema_specific_header(header_row: list[str]) -> bool:
     if len(header_row) != N_COLS:
         return False
-    cleaned = tuple(_normalise_header_for_match(c or "") for c in header_row)
-    expected = tuple(_normalise_header_for_match(c) for c in HEADERS)
-    return cleaned == expected
+    return all(
+        _normalise_header_for_match(c or "") == expected
+        for c, expected in zip(header_row, _EXPECTED_HEADER)
+    )
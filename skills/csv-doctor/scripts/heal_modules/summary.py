@@ -19,8 +19,12 @@ def build_structured_summary(
     contract = build_contract("csv_doctor.heal_summary")
     clean_rows = len(result["clean_data"])
     quarantine_rows = len(result["quarantine"])
-    needs_review_rows = sum(1 for row in result["clean_data"] if row.needs_review)
-    modified_rows = sum(1 for row in result["clean_data"] if row.was_modified)
+    needs_review_rows = modified_rows = 0
+    for row in result["clean_data"]:
+        if row.needs_review:
+            needs_review_rows += 1
+        if row.was_modified:
+            modified_rows += 1
     applied_role_overrides = {
         str(idx + 1): role for idx, role in sorted((role_overrides or {}).items())
     }
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import zipfile
+from itertools import chain, islice, zip_longest
 from pathlib import Path
+from typing import Iterator
+from xml.sax.saxutils import escape as xml_escape
 
 import openpyxl
 from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.exceptions import IllegalCharacterError
 
 from heal_modules.shared import HEADERS, WRITE_ONLY_THRESHOLD, Change, CleanRow, QuarantineRow
 
@@ -15,32 +21,203 @@ def _header_font() -> Font:
 def _header_fill(hex_color: str) -> PatternFill:
     return PatternFill("solid", fgColor=hex_color)
 
-def _style_sheet(ws, col_widths: list[int], header_color: str):
-    """Apply bold header, color, frozen row, and column widths."""
+def _header_cells(ws, headers: list[str], header_color: str) -> list[WriteOnlyCell]:
+    """Build the bold, colored, centered header row for a write-only sheet."""
     fill = _header_fill(header_color)
     font = _header_font()
-    for cell in ws[1]:
-        cell.font  = font
-        cell.fill  = fill
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=False)
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = font
+        cell.fill = fill
+        cell.alignment = HEADER_ALIGN
+        cells.append(cell)
+    return cells
+
+def _style_sheet(ws, col_widths: list[int], wrap_columns: tuple[int, ...] = ()):
+    """Apply frozen header row, column widths and column-default wrapping.
+
+    Must run before the first append. A column default only covers cells
+    written without their own style, so populated cells in *wrap_columns*
+    still carry WRAP_TOP individually.
+    """
     ws.freeze_panes = "A2"
     for i, width in enumerate(col_widths, start=1):
         ws.column_dimensions[get_column_letter(i)].width = width
+    for idx in wrap_columns:
+        ws.column_dimensions[get_column_letter(idx + 1)].alignment = WRAP_TOP
 
 
 def _infer_col_widths(rows: list[list], min_width: int = 10, max_width: int = 60, sample: int = 300) -> list[int]:
     if not rows:
         return []
-    widths = [max(min_width, min(max_width, len(str(v)) + 2)) for v in rows[0]]
-    for row in rows[1 : sample + 1]:
-        for i, val in enumerate(row):
-            widths[i] = max(widths[i], min(max_width, len(str(val)) + 2))
-    return [max(min_width, min(max_width, w)) for w in widths]
+    # Column-wise reduction: one max() over map(len, map(str, ...)) per column
+    # keeps the per-cell work inside C instead of a nested Python loop.
+    columns = zip_longest(*rows[: sample + 1], fillvalue="")
+    return [
+        max(min_width, min(max_width, max(map(len, map(str, column))) + 2))
+        for column, _ in zip(columns, rows[0])
+    ]
+
+def _take_width_sample(headers: list[str], rows: Iterator[list], sample: int = 300) -> tuple[list[int], Iterator[list]]:
+    """Measure widths from the first *sample* rows and hand them back for emission.
+
+    Write-only sheets need widths before the first append, so the sampled rows
+    are built once, measured, and then re-chained in front of the rest.
+    """
+    head = list(islice(rows, sample))
+    return _infer_col_widths([headers] + head, sample=sample), chain(head, rows)
 
 # Accent fills for was_modified / needs_review cells
 FILL_MODIFIED = PatternFill("solid", fgColor="FFF2CC")   # soft yellow
 FILL_REVIEW   = PatternFill("solid", fgColor="FCE4D6")   # soft orange
 
+# Shared by reference so openpyxl registers a single style entry
+WRAP_TOP     = Alignment(wrap_text=True, vertical="top")
+HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=False)
+
+
+# ── Direct XLSX streaming (large outputs) ───────────────────────────────────
+# Large workbooks skip openpyxl's cell objects entirely: each sheet's XML is
+# streamed straight into the zip as pre-formatted <row> fragments with inline
+# strings, so the write is bound by zlib rather than per-cell Python objects.
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}'
+    '</Types>'
+)
+
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+# cellXfs indexes: 1–3 green/red/blue header, 4 modified flag, 5 review flag
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><color rgb="00FFFFFF"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="7">'
+    '<fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="004CAF50"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00E53935"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="001565C0"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00FFF2CC"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00FCE4D6"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="6">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="3" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="4" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="5" borderId="0" xfId="0" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="6" borderId="0" xfId="0" applyFill="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '<selection pane="bottomLeft" activeCell="A2" sqref="A2"/>'
+    '</sheetView></sheetViews>'
+    '<sheetFormatPr defaultRowHeight="15"/><cols>{cols}</cols><sheetData>'
+)
+_XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+
+_STYLE_HEADER_GREEN = 1
+_STYLE_HEADER_RED = 2
+_STYLE_HEADER_BLUE = 3
+_STYLE_MODIFIED = 4
+_STYLE_REVIEW = 5
+
+_XLSX_FLUSH_ROWS = 1000
+
+
+def _xlsx_text(value: str, cache: dict[str, str]) -> str:
+    """Truncate, validate and escape a string once per write; repeats hit *cache*."""
+    escaped = cache.get(value)
+    if escaped is None:
+        text = value[:32767]
+        if ILLEGAL_CHARACTERS_RE.search(text):
+            raise IllegalCharacterError(f"{text} cannot be used in worksheets.")
+        escaped = cache[value] = xml_escape(text)
+    return escaped
+
+
+def _xlsx_cell(ref: str, value, style: int, cache: dict[str, str]) -> str:
+    """Render one <c> element. Mirrors openpyxl's typing and string checks."""
+    attrs = f' r="{ref}" s="{style}"' if style else f' r="{ref}"'
+    if type(value) is str:
+        if not value:
+            return f"<c{attrs}/>" if style else ""
+        if len(value) > 1 and value[0] == "=":
+            # openpyxl stores any "=..." string as a formula; keep both writers in step
+            return f"<c{attrs}><f>{_xlsx_text(value, cache)[1:]}</f><v></v></c>"
+        return f'<c{attrs} t="inlineStr"><is><t xml:space="preserve">{_xlsx_text(value, cache)}</t></is></c>'
+    if value is None:
+        return f"<c{attrs}/>" if style else ""
+    if value is True or value is False:
+        return f'<c{attrs} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c{attrs}><v>{value!r}</v></c>"
+    text = str(value)
+    if not text:
+        return f"<c{attrs}/>" if style else ""
+    return f'<c{attrs} t="inlineStr"><is><t xml:space="preserve">{_xlsx_text(text, cache)}</t></is></c>'
+
+
+def _write_sheet_xml(
+    zf: zipfile.ZipFile,
+    arcname: str,
+    headers: list[str],
+    header_style: int,
+    rows,
+    text_cache: dict[str, str],
+) -> None:
+    """Stream one worksheet: header row, then (values, styles) pairs from *rows*."""
+    letters = [get_column_letter(i) for i in range(1, len(headers) + 1)]
+    cols = "".join(
+        f'<col min="{i}" max="{i}" width="15" customWidth="1"/>' for i in range(1, len(headers) + 1)
+    )
+    with zf.open(arcname, "w") as fh:
+        fh.write(_XLSX_SHEET_HEAD.format(cols=cols).encode("utf-8"))
+        header_cells = "".join(
+            _xlsx_cell(f"{letter}1", h, header_style, text_cache) for letter, h in zip(letters, headers)
+        )
+        buf = [f'<row r="1">{header_cells}</row>']
+        for r, (values, styles) in enumerate(rows, start=2):
+            cells = "".join(
+                _xlsx_cell(f"{letter}{r}", v, st, text_cache) for letter, v, st in zip(letters, values, styles)
+            )
+            buf.append(f'<row r="{r}">{cells}</row>')
+            if len(buf) >= _XLSX_FLUSH_ROWS:
+                fh.write("".join(buf).encode("utf-8"))
+                buf.clear()
+        buf.append(_XLSX_SHEET_TAIL)
+        fh.write("".join(buf).encode("utf-8"))
+
 
 def _write_workbook_fast_impl(
     clean_data:  list[CleanRow],
@@ -49,55 +226,86 @@ def _write_workbook_fast_impl(
     output_path: Path,
     headers: list[str],
 ) -> None:
-    """Write_only=True path for large outputs — 5–10× faster than regular openpyxl."""
-    wb = openpyxl.Workbook(write_only=True)
+    """Stream the XLSX parts directly for large outputs — no openpyxl cell objects."""
+    clean_headers = headers + ["was_modified", "needs_review"]
+    quarantine_headers = headers + ["quarantine_reason"]
+    log_headers = ["original_row_number", "column_affected",
+                   "original_value", "new_value", "action_taken", "reason"]
+    sheet_names = ["Clean Data", "Quarantine", "Change Log"]
 
-    hdr_font = Font(bold=True, color="FFFFFF")
+    plain_quarantine = [0] * len(quarantine_headers)
+    plain_log = [0] * len(log_headers)
+    # One shared style row per (was_modified, needs_review) combination
+    clean_styles = {
+        (modified, review): [0] * len(headers) + [
+            _STYLE_MODIFIED if modified else 0,
+            _STYLE_REVIEW if review else 0,
+        ]
+        for modified in (False, True)
+        for review in (False, True)
+    }
 
-    def _hdr_cell(ws, value: str, hex_color: str) -> WriteOnlyCell:
-        c = WriteOnlyCell(ws, value=value)
-        c.font = hdr_font
-        c.fill = PatternFill("solid", fgColor=hex_color)
-        return c
+    def _clean_rows():
+        for entry in clean_data:
+            modified = bool(entry.was_modified)
+            review = bool(entry.needs_review)
+            yield entry.row + [entry.was_modified, entry.needs_review], clean_styles[modified, review]
 
-    # ── Sheet 1 — Clean Data ────────────────────────────────────────────
-    ws1 = wb.create_sheet("Clean Data")
-    clean_headers = headers + ["was_modified", "needs_review"]
-    for i in range(1, len(clean_headers) + 1):
-        ws1.column_dimensions[get_column_letter(i)].width = 15
-    ws1.append([_hdr_cell(ws1, h, "4CAF50") for h in clean_headers])
-    for entry in clean_data:
-        row_out = list(entry.row)
-        mod_cell = WriteOnlyCell(ws1, value=entry.was_modified)
-        rev_cell = WriteOnlyCell(ws1, value=entry.needs_review)
-        if entry.was_modified:
-            mod_cell.fill = FILL_MODIFIED
-        if entry.needs_review:
-            rev_cell.fill = FILL_REVIEW
-        ws1.append(row_out + [mod_cell, rev_cell])
+    def _quarantine_rows():
+        for q in quarantine:
+            yield q.row + [q.reason], plain_quarantine
 
-    # ── Sheet 2 — Quarantine ────────────────────────────────────────────
-    ws2 = wb.create_sheet("Quarantine")
-    quarantine_headers = headers + ["quarantine_reason"]
-    for i in range(1, len(quarantine_headers) + 1):
-        ws2.column_dimensions[get_column_letter(i)].width = 15
-    ws2.append([_hdr_cell(ws2, h, "E53935") for h in quarantine_headers])
-    for q in quarantine:
-        ws2.append(q.row + [q.reason])
+    def _log_rows():
+        for c in changelog:
+            yield (
+                [c.original_row_number, c.column_affected,
+                 c.original_value, c.new_value, c.action_taken, c.reason],
+                plain_log,
+            )
 
-    # ── Sheet 3 — Change Log ────────────────────────────────────────────
-    ws3 = wb.create_sheet("Change Log")
-    log_headers = ["original_row_number", "column_affected",
-                   "original_value", "new_value", "action_taken", "reason"]
-    for i in range(1, len(log_headers) + 1):
-        ws3.column_dimensions[get_column_letter(i)].width = 15
-    ws3.append([_hdr_cell(ws3, h, "1565C0") for h in log_headers])
-    for c in changelog:
-        ws3.append([c.original_row_number, c.column_affected,
-                    c.original_value, c.new_value, c.action_taken, c.reason])
+    sheet_overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, len(sheet_names) + 1)
+    )
+    workbook_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<bookViews><workbookView/></bookViews><sheets>'
+        + "".join(
+            f'<sheet name="{xml_escape(name)}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, name in enumerate(sheet_names, start=1)
+        )
+        + "</sheets></workbook>"
+    )
+    workbook_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        + "".join(
+            f'<Relationship Id="rId{i}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, len(sheet_names) + 1)
+        )
+        + f'<Relationship Id="rId{len(sheet_names) + 1}" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(output_path)
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES.format(sheets=sheet_overrides))
+        zf.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", workbook_xml)
+        zf.writestr("xl/_rels/workbook.xml.rels", workbook_rels)
+        zf.writestr("xl/styles.xml", _XLSX_STYLES)
+        # Escaped text is shared across the three sheets and dropped with this write
+        text_cache: dict[str, str] = {}
+        _write_sheet_xml(zf, "xl/worksheets/sheet1.xml", clean_headers, _STYLE_HEADER_GREEN, _clean_rows(), text_cache)
+        _write_sheet_xml(zf, "xl/worksheets/sheet2.xml", quarantine_headers, _STYLE_HEADER_RED, _quarantine_rows(), text_cache)
+        _write_sheet_xml(zf, "xl/worksheets/sheet3.xml", log_headers, _STYLE_HEADER_BLUE, _log_rows(), text_cache)
 
 
 def _write_workbook_standard_impl(
@@ -107,61 +315,69 @@ def _write_workbook_standard_impl(
     output_path: Path,
     headers: list[str] | None = None,
 ) -> None:
-    wb = openpyxl.Workbook()
+    wb = openpyxl.Workbook(write_only=True)
+
+    def _wrapped(ws, value):
+        if value is None or value == "":
+            return value   # column default covers blanks
+        cell = WriteOnlyCell(ws, value=value)
+        cell.alignment = WRAP_TOP
+        return cell
 
     # ── Sheet 1 — Clean Data ─────────────────────────────────────────────
-    ws1 = wb.active
-    ws1.title = "Clean Data"
+    ws1 = wb.create_sheet("Clean Data")
     clean_headers = headers + ["was_modified", "needs_review"]
-    clean_rows_for_width = [clean_headers]
-    ws1.append(clean_headers)
-    for entry in clean_data:
-        row_out = entry.row + [entry.was_modified, entry.needs_review]
-        ws1.append(row_out)
-        clean_rows_for_width.append(row_out)
-        # Accent modified / review flag cells
-        last = ws1.max_row
-        mod_cell    = ws1.cell(last, len(headers) + 1)
-        review_cell = ws1.cell(last, len(headers) + 2)
-        if entry.was_modified:
+    notes_idx = headers.index("Notes") if "Notes" in headers else None
+    col_widths, clean_rows = _take_width_sample(
+        clean_headers,
+        (entry.row + [entry.was_modified, entry.needs_review] for entry in clean_data),
+    )
+    _style_sheet(ws1, col_widths, wrap_columns=(notes_idx,) if notes_idx is not None else ())
+    ws1.append(_header_cells(ws1, clean_headers, "4CAF50"))   # green
+    for row_out in clean_rows:
+        was_modified = row_out[-2]
+        needs_review = row_out[-1]
+        # Notes column text-wrap
+        if notes_idx is not None:
+            row_out[notes_idx] = _wrapped(ws1, row_out[notes_idx])
+        # Accent modified / review flag cells; unflagged ones stay plain values
+        if was_modified:
+            mod_cell = WriteOnlyCell(ws1, value=was_modified)
             mod_cell.fill = FILL_MODIFIED
-        if entry.needs_review:
+            row_out[-2] = mod_cell
+        if needs_review:
+            review_cell = WriteOnlyCell(ws1, value=needs_review)
             review_cell.fill = FILL_REVIEW
-    _style_sheet(ws1, _infer_col_widths(clean_rows_for_width), "4CAF50")   # green
+            row_out[-1] = review_cell
+        ws1.append(row_out)
 
     # ── Sheet 2 — Quarantine ─────────────────────────────────────────────
     ws2 = wb.create_sheet("Quarantine")
     quarantine_headers = headers + ["quarantine_reason"]
-    quarantine_rows_for_width = [quarantine_headers]
-    ws2.append(quarantine_headers)
-    for q in quarantine:
-        row_out = q.row + [q.reason]
+    col_widths, quarantine_rows = _take_width_sample(
+        quarantine_headers, (q.row + [q.reason] for q in quarantine)
+    )
+    _style_sheet(ws2, col_widths)
+    ws2.append(_header_cells(ws2, quarantine_headers, "E53935"))   # red
+    for row_out in quarantine_rows:
         ws2.append(row_out)
-        quarantine_rows_for_width.append(row_out)
-    _style_sheet(ws2, _infer_col_widths(quarantine_rows_for_width), "E53935")   # red
 
     # ── Sheet 3 — Change Log ─────────────────────────────────────────────
     ws3 = wb.create_sheet("Change Log")
     log_headers = ["original_row_number", "column_affected",
                    "original_value", "new_value", "action_taken", "reason"]
-    log_rows_for_width = [log_headers]
-    ws3.append(log_headers)
-    for c in changelog:
-        row_out = [c.original_row_number, c.column_affected,
-                   c.original_value, c.new_value, c.action_taken, c.reason]
+    col_widths, log_rows = _take_width_sample(
+        log_headers,
+        ([c.original_row_number, c.column_affected,
+          c.original_value, c.new_value, c.action_taken, c.reason]
+         for c in changelog),
+    )
+    _style_sheet(ws3, col_widths, wrap_columns=(len(log_headers) - 1,))
+    ws3.append(_header_cells(ws3, log_headers, "1565C0"))   # blue
+    for row_out in log_rows:
+        # Reason column text-wrap
+        row_out[-1] = _wrapped(ws3, row_out[-1])
         ws3.append(row_out)
-        log_rows_for_width.append(row_out)
-    _style_sheet(ws3, _infer_col_widths(log_rows_for_width), "1565C0")   # blue
-
-    # Notes column text-wrap in Sheet 1
-    if "Notes" in headers:
-        notes_col = get_column_letter(headers.index("Notes") + 1)
-        for cell in ws1[notes_col][1:]:
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    # Reason column text-wrap in Sheet 3
-    for cell in ws3["F"][1:]:
-        cell.alignment = Alignment(wrap_text=True, vertical="top")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     wb.save(output_path)
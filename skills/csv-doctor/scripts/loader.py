@@ -15,6 +15,7 @@ Result dict keys:
     encoding_info     — full dict: detected, confidence, is_utf8, suspicious_chars
     delimiter         — delimiter char for text files; None otherwise
     raw_text          — decoded text for text files; None otherwise
+    raw_rows          — csv-parsed rows of raw_text for delimited text files; None otherwise
     sheet_name        — active sheet name for spreadsheets; None otherwise
     sheet_names       — all available sheet names for spreadsheets; None otherwise
     original_rows     — row count including header row
@@ -106,8 +107,19 @@ def _read_text_safely(raw: bytes, preferred_encoding: str) -> str:
       3. Try latin-1
       4. CP1252 with replace (never crashes)
 
-    Also strips embedded null bytes so downstream parsers don't choke.
+    Also strips embedded null bytes so downstream parsers don't choke, and a
+    leading UTF-8 BOM so it doesn't end up glued to the first header.
     """
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]
+
+    # Fast path: a buffer that is valid UTF-8 as a whole decodes identically
+    # line by line (b"\n" never splits a multi-byte sequence).
+    try:
+        return raw.decode("utf-8").replace("\x00", "")
+    except UnicodeDecodeError:
+        pass
+
     decoded_lines: list[str] = []
     for raw_line in raw.split(b"\n"):
         decoded: str | None = None
@@ -445,6 +457,7 @@ def _load_text(path: Path, suffix: str) -> dict:
         "encoding_info":    enc_info,
         "delimiter":        delimiter,
         "raw_text":         text,
+        "raw_rows":         raw_rows,
         "sheet_name":       None,
         "sheet_names":      None,
         "original_rows":    len(raw_rows),
@@ -588,6 +601,7 @@ def _load_excel(
         "encoding_info":    None,
         "delimiter":        None,
         "raw_text":         None,
+        "raw_rows":         None,
         "sheet_name":       active_sheet,
         "sheet_names":      all_sheets,
         "original_rows":    len(df) + 1,
@@ -701,6 +715,7 @@ def _load_ods(
         "encoding_info":    None,
         "delimiter":        None,
         "raw_text":         None,
+        "raw_rows":         None,
         "sheet_name":       active_sheet,
         "sheet_names":      all_sheets,
         "original_rows":    len(df) + 1,
@@ -775,6 +790,7 @@ def _load_json(path: Path) -> dict:
         "encoding_info":    enc_info,
         "delimiter":        None,
         "raw_text":         text,
+        "raw_rows":         None,
         "sheet_name":       None,
         "sheet_names":      None,
         "original_rows":    len(df) + 1,
@@ -839,6 +855,7 @@ def _load_jsonl(path: Path) -> dict:
         "encoding_info":    enc_info,
         "delimiter":        None,
         "raw_text":         text,
+        "raw_rows":         None,
         "sheet_name":       None,
         "sheet_names":      None,
         "original_rows":    len(df) + 1,
@@ -877,7 +894,7 @@ def load_file(
 
     Returns:
         dict with keys: dataframe, detected_format, detected_encoding,
-        encoding_info, delimiter, raw_text, sheet_name, sheet_names,
+        encoding_info, delimiter, raw_text, raw_rows, sheet_name, sheet_names,
         original_rows, original_columns, warnings.
 
     Raises:
@@ -104,6 +104,63 @@ class SheetDoctorCliTests(unittest.TestCase):
             )
             self.assertEqual(proc.returncode, 5, proc.stderr)
 
+    def test_heal_csv_format_writes_changelog_rows(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            proc = run_cli("heal", "sample-data/extreme_mess.csv", "--out", tmpdir, "--format", "csv")
+            self.assertEqual(proc.returncode, 4, proc.stderr)
+            changelog = (Path(tmpdir) / "extreme_mess-changelog.csv").read_text(encoding="utf-8").splitlines()
+            self.assertEqual(changelog[0], "action,row_number,column_name,old_value,new_value,reason")
+            self.assertGreater(len(changelog), 1)
+
+    def test_heal_jsonl_format_writes_one_record_per_line(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            proc = run_cli("heal", "sample-data/extreme_mess.csv", "--out", tmpdir, "--format", "jsonl")
+            self.assertEqual(proc.returncode, 4, proc.stderr)
+            out = Path(tmpdir)
+            clean = [json.loads(line) for line in (out / "extreme_mess-clean.jsonl").read_text(encoding="utf-8").splitlines()]
+            quarantine = [
+                json.loads(line) for line in (out / "extreme_mess-quarantine.jsonl").read_text(encoding="utf-8").splitlines()
+            ]
+            changelog = [
+                json.loads(line) for line in (out / "extreme_mess-changelog.jsonl").read_text(encoding="utf-8").splitlines()
+            ]
+            self.assertTrue(clean)
+            self.assertIn("Employee Name", clean[0]["values"])
+            self.assertIn("needs_review", clean[0])
+            self.assertTrue(all(record["quarantine_reason"] for record in quarantine))
+            self.assertEqual(
+                set(changelog[0]),
+                {"action", "row_number", "column_name", "old_value", "new_value", "reason"},
+            )
+
+    def test_heal_explicit_output_keeps_tabular_streams_separate(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for fmt in ("csv", "jsonl"):
+                out = Path(tmpdir) / fmt
+                output_path = out / f"out.{fmt}"
+                proc = run_cli(
+                    "heal",
+                    "sample-data/extreme_mess.csv",
+                    "--out",
+                    str(out),
+                    "--output",
+                    str(output_path),
+                    "--format",
+                    fmt,
+                )
+                self.assertEqual(proc.returncode, 4, proc.stderr)
+                clean = output_path.read_text(encoding="utf-8").splitlines()
+                quarantine = (out / f"out-quarantine.{fmt}").read_text(encoding="utf-8").splitlines()
+                changelog = (out / f"out-changelog.{fmt}").read_text(encoding="utf-8").splitlines()
+                if fmt == "csv":
+                    self.assertTrue(clean[0].endswith("was_modified,needs_review"))
+                    self.assertTrue(quarantine[0].endswith("quarantine_reason"))
+                    self.assertTrue(changelog[0].startswith("action,"))
+                else:
+                    self.assertIn("needs_review", json.loads(clean[0]))
+                    self.assertIn("quarantine_reason", json.loads(quarantine[0]))
+                    self.assertIn("action", json.loads(changelog[0]))
+
     def test_heal_dry_run_does_not_write_files(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             proc = run_cli(
@@ -114,6 +114,12 @@ class DataShapeEdgeTests(unittest.TestCase):
         self.assertTrue(changed)
         self.assertRegex(value, r"^\d{4}-\d{2}-\d{2}$")
 
+    def test_iso_day_gap_rejects_impossible_dates(self):
+        self.assertEqual(self.normalization.iso_day_gap("2024-02-28", "2024-03-01"), 2)
+        self.assertEqual(self.normalization.iso_day_gap("2024-03-01", "2024-02-28"), 2)
+        self.assertIsNone(self.normalization.iso_day_gap("2023-02-29", "2023-03-01"))
+        self.assertIsNone(self.normalization.iso_day_gap("2024-01-01", "01/02/2024"))
+
     def test_negative_amounts_normalise_from_accounting_format(self):
         value, changed, _ = self.normalization.normalise_amount("(500)")
 
@@ -5,7 +5,7 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -447,6 +447,47 @@ class HealEdgeCaseTests(unittest.TestCase):
             leftovers = list(output_path.parent.glob(".atomic.*.xlsx"))
             self.assertEqual(leftovers, [])
 
+    def test_write_workbook_streams_large_outputs_readably(self):
+        clean = [
+            self.heal.CleanRow(row=[f"Row <{i}> & co", ""], row_num=i + 2, was_modified=i == 0, needs_review=False)
+            for i in range(self.heal.WRITE_ONLY_THRESHOLD + 1)
+        ]
+        quarantine = [self.heal.QuarantineRow(row=["=SUM(A1:A3)", ""], row_num=9, reason="Formula residue")]
+        changelog = [self.heal.Change(2, "name", "row <0>", "Row <0> & co", "modified", "Trimmed whitespace")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "large.xlsx"
+            self.heal.write_workbook(clean, quarantine, changelog, output_path, headers=["name", "note"])
+
+            wb = load_workbook(output_path)
+            self.assertEqual(wb.sheetnames, ["Clean Data", "Quarantine", "Change Log"])
+            clean_ws = wb["Clean Data"]
+            self.assertEqual(clean_ws.max_row, len(clean) + 1)
+            self.assertEqual(clean_ws["A2"].value, "Row <0> & co")
+            self.assertIsNone(clean_ws["B2"].value)
+            self.assertIs(clean_ws["C2"].value, True)
+            self.assertEqual(clean_ws["C2"].fill.fgColor.rgb, "00FFF2CC")
+            self.assertTrue(clean_ws["A1"].font.b)
+            self.assertEqual(clean_ws.freeze_panes, "A2")
+            self.assertEqual(wb["Quarantine"]["A2"].value, "=SUM(A1:A3)")
+            self.assertEqual(wb["Change Log"]["A2"].value, 2)
+
+    def test_write_workbook_types_formula_residue_the_same_on_both_writers(self):
+        quarantine = [self.heal.QuarantineRow(row=["=SUM(A1:A3)", ""], row_num=9, reason="Formula residue")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for clean_rows in (10, self.heal.WRITE_ONLY_THRESHOLD + 1):
+                clean = [
+                    self.heal.CleanRow(row=[f"Row {i}", ""], row_num=i + 2, was_modified=False, needs_review=False)
+                    for i in range(clean_rows)
+                ]
+                output_path = Path(tmpdir) / f"formula-{clean_rows}.xlsx"
+                self.heal.write_workbook(clean, quarantine, [], output_path, headers=["name", "note"])
+
+                cell = load_workbook(output_path)["Quarantine"]["A2"]
+                self.assertEqual(cell.data_type, "f", clean_rows)
+                self.assertEqual(cell.value, "=SUM(A1:A3)", clean_rows)
+
     def test_committed_preamble_workbook_fixture_heals(self):
         result = self.heal.execute_healing(WORKBOOK_FIXTURE_DIR / "preamble_workbook.xlsx", sheet_name="Transactions")
 
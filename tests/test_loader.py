@@ -47,6 +47,16 @@ class LoaderLocalBehaviorTests(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "File is empty"):
                 self.loader.load_file(path)
 
+    def test_leading_utf8_bom_is_dropped_from_first_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "bom.csv"
+            path.write_bytes(b"\xef\xbb\xbfname,amount\nAda,10\n")
+
+            result = self.loader.load_file(path)
+
+        self.assertEqual(result["raw_rows"][0], ["name", "amount"])
+        self.assertFalse(result["raw_text"].startswith("\ufeff"))
+
     def test_missing_xlrd_raises_clear_importerror(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "legacy.xls"